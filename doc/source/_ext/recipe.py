@@ -1,4 +1,6 @@
-from collections import defaultdict
+from operator import itemgetter
+import re
+import sys
 
 from docutils.parsers.rst import directives
 
@@ -9,12 +11,25 @@ from sphinx.roles import XRefRole
 from sphinx.util.nodes import make_refnode
 
 
+# separator between ingredients in the 'contains' option, eating whitespace
+_INGREDIENT_SEP = re.compile(r'\s*,\s*')
+
+
+def ingredients_option(argument):
+    """Parse a comma separated ingredient list into a tuple of names."""
+    argument = directives.unchanged_required(argument).strip()
+    # ingredients recur across recipes, so share one string per name
+    return tuple(
+        sys.intern(x) for x in _INGREDIENT_SEP.split(argument) if x
+    )
+
+
 class RecipeDirective(ObjectDescription):
     """A custom directive that describes a recipe."""
     has_content = True
     required_arguments = 1
     option_spec = {
-        'contains': directives.unchanged_required,
+        'contains': ingredients_option,
     }
 
     def handle_signature(self, sig, signode):
@@ -23,11 +38,8 @@ class RecipeDirective(ObjectDescription):
 
     def add_target_and_index(self, name_cls, sig, signode):
         signode['ids'].append('recipe' + '-' + sig)
-        if 'contains' in self.options:
-            ingredients = [
-                x.strip() for x in self.options.get('contains').split(',')
-            ]
-
+        ingredients = self.options.get('contains')
+        if ingredients:
             recipes = self.env.get_domain('recipe')
             recipes.add_recipe(sig, ingredients)
 
@@ -39,34 +51,30 @@ class IngredientIndex(Index):
     shortname = 'Ingredient'
 
     def generate(self, docnames=None):
-        content = defaultdict(list)
-
-        recipes = {
-            name: (dispname, typ, docname, anchor)
-            for name, dispname, typ, docname, anchor, _
-            in self.domain.get_objects()
-        }
+        recipe_index = self.domain.data['recipe_index']
         recipe_ingredients = self.domain.data['recipe_ingredients']
-        ingredient_recipes = defaultdict(list)
 
-        # flip from recipe_ingredients to ingredient_recipes
-        for recipe_name, ingredients in recipe_ingredients.items():
-            for ingredient in ingredients:
-                ingredient_recipes[ingredient].append(recipe_name)
+        # create every group up front, in sorted order, so the loop below only
+        # appends and the result needs no final sort
+        keys = {
+            ingredient
+            for ingredients in recipe_ingredients.values()
+            for ingredient in ingredients
+        }
+        content = {key: [] for key in sorted(keys)}
 
-        # convert the mapping of ingredient to recipes to produce the expected
-        # output, shown below, using the ingredient name as a key to group.
+        # invert recipe_ingredients in a single pass, using the ingredient
+        # name as a key to group recipes into the expected output, shown below
         #
         # name, subtype, docname, anchor, extra, qualifier, description
-        for ingredient, recipe_names in ingredient_recipes.items():
-            for recipe_name in recipe_names:
-                dispname, typ, docname, anchor = recipes[recipe_name]
-                content[ingredient].append(
-                    (dispname, 0, docname, anchor, docname, '', typ)
-                )
+        for recipe_name, ingredients in recipe_ingredients.items():
+            _, dispname, typ, docname, anchor, _ = recipe_index[recipe_name]
+            entry = (dispname, 0, docname, anchor, docname, '', typ)
+            for ingredient in ingredients:
+                content[ingredient].append(entry)
 
         # convert the dict to the sorted list of tuples expected
-        content = sorted(content.items())
+        content = list(content.items())
 
         return content, True
 
@@ -79,23 +87,38 @@ class RecipeIndex(Index):
     shortname = 'Recipe'
 
     def generate(self, docnames=None):
-        content = defaultdict(list)
-
-        # sort the list of recipes in alphabetical order
-        recipes = self.domain.get_objects()
-        recipes = sorted(recipes, key=lambda recipe: recipe[0])
+        recipes = self.domain.data['recipes']
+
+        # create every group up front, in sorted order, so the loop below only
+        # appends and the result needs no final sort
+        keys = {dispname[0].lower() for dispname in recipes['dispname']}
+        content = {key: [] for key in sorted(keys)}
+
+        # sort the recipes in alphabetical order, reading only the columns
+        # needed for the index
+        recipes = sorted(
+            zip(
+                recipes['dispname'],
+                recipes['typ'],
+                recipes['docname'],
+                recipes['anchor'],
+            ),
+            key=itemgetter(0),
+        )
 
         # generate the expected output, shown below, from the above using the
         # first letter of the recipe as a key to group thing
         #
         # name, subtype, docname, anchor, extra, qualifier, description
-        for _name, dispname, typ, docname, anchor, _priority in recipes:
-            content[dispname[0].lower()].append(
+        bucket = content.__getitem__
+        for dispname, typ, docname, anchor in recipes:
+            bucket(dispname[0].lower()).append(
                 (dispname, 0, docname, anchor, docname, '', typ)
             )
 
-        # convert the dict to sorted list of tuples expected
-        content = sorted(content.items())
+        # convert the dict to sorted list of tuples expected; the entries in
+        # each group are already in order because recipes were sorted up front
+        content = list(content.items())
 
         return content, True
 
@@ -113,19 +136,91 @@ class RecipeDomain(Domain):
         RecipeIndex,
         IngredientIndex,
     }
-    initia_data = {
-        'recipes': [],  # object list
+    initial_data = {
+        # object columns, one list per field of the tuples in get_objects
+        'recipes': {
+            'name': [],
+            'dispname': [],
+            'typ': [],
+            'docname': [],
+            'anchor': [],
+            'prio': [],
+        },
         'recipe_ingredients': {},  # name -> object
+        'recipe_index': {},  # name -> object
     }
+    # bump whenever the layout of initial_data changes
+    data_version = 2
 
     def get_full_qualified_name(self, node):
         return f'recipe.{node.arguments[0]}'
 
     def get_objects(self):
-        yield from self.data['recipes']
+        yield from zip(*self.data['recipes'].values())
+
+    def clear_doc(self, docname):
+        recipes = self.data['recipes']
+        recipe_ingredients = self.data['recipe_ingredients']
+        recipe_index = self.data['recipe_index']
+        keep = []
+        for i, (name, recipe_docname) in enumerate(
+            zip(recipes['name'], recipes['docname'])
+        ):
+            if recipe_docname == docname:
+                recipe_ingredients.pop(name, None)
+                recipe_index.pop(name, None)
+            else:
+                keep.append(i)
+
+        if len(keep) < len(recipes['name']):
+            for column in recipes.values():
+                column[:] = [column[i] for i in keep]
+
+    def merge_domaindata(self, docnames, otherdata):
+        recipes = self.data['recipes']
+        other_recipes = otherdata['recipes']
+        for recipe in zip(*other_recipes.values()):
+            name, _dispname, _typ, docname, _anchor, _priority = recipe
+            if docname not in docnames:
+                continue
+            for column, value in zip(recipes.values(), recipe):
+                column.append(value)
+            self.data['recipe_index'][name] = recipe
+            if name in otherdata['recipe_ingredients']:
+                self.data['recipe_ingredients'][name] = (
+                    otherdata['recipe_ingredients'][name]
+                )
 
     def resolve_xref(
             self, env, fromdocname, builder, typ, target, node, contnode
     ):
-        
-    
+        match = self.data['recipe_index'].get(f'recipe.{target}')
+        if match is None:
+            return None
+
+        _name, _sig, _typ, todocname, targ, _priority = match
+        return make_refnode(
+            builder, fromdocname, todocname, targ, contnode, targ
+        )
+
+    def add_recipe(self, signature, ingredients):
+        """Add a new recipe to the domain."""
+        name = f'recipe.{signature}'
+        anchor = f'recipe-{signature}'
+
+        self.data['recipe_ingredients'][name] = ingredients
+        # name, dispname, type, docname, anchor, priority
+        recipe = (name, signature, 'Recipe', self.env.docname, anchor, 0)
+        for column, value in zip(self.data['recipes'].values(), recipe):
+            column.append(value)
+        self.data['recipe_index'][name] = recipe
+
+
+def setup(app):
+    app.add_domain(RecipeDomain)
+
+    return {
+        'version': '0.1',
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }
@@ -1,5 +1,3 @@
-import matplotlib
-import matplotlib.pyplot as plt
 import os
 import sys
 
@@ -41,11 +39,6 @@ extensions = [
 
 todo_include_todos = True
 
-# Do some matplotlib config in case users have a matplotlibrc that will break
-# things
-matplotlib.use('agg')
-plt.ioff()
-
 templates_path = ['_templates']
 exclude_patterns = []
 
@@ -76,3 +69,17 @@ html_file_suffix = '.html'
 htmlhelp_basename = 'scipy'
 
 mathjax_path = "scipy-mathjax/MathJax.js?config=scipy-mathjax"
+
+
+def _configure_matplotlib(app):
+    # Do some matplotlib config in case users have a matplotlibrc that will
+    # break things
+    import matplotlib
+    matplotlib.use('agg')
+
+    import matplotlib.pyplot as plt
+    plt.ioff()
+
+
+def setup(app):
+    app.connect('builder-inited', _configure_matplotlib)
@@ -1,6 +1,7 @@
 """Wraps scipy's RBFInterpolator but replaces docstring."""
 
 
+import numpy as np
 from scipy.interpolate import RBFInterpolator
 
 
@@ -108,7 +109,11 @@ class RBFInterpolator2(RBFInterpolator):
     impractical when interpolating more than about a thousand data points.
     To overcome memory limitations for large interpolation problems, the
     `neighbors` argument can be specified to compute an RBF interpolant for
-    each evaluation point using only the nearest data points.
+    each evaluation point using only the nearest data points. The KD-tree
+    used to find those data points is built once, when the interpolant is
+    constructed, and is reused by every evaluation. Passing many small
+    batches of evaluation points to `call_many` rather than `__call__` also
+    shares the per-call overhead of the neighbor queries.
 
     .. versionadded:: 1.7.0
 
@@ -159,6 +164,8 @@ class RBFInterpolator2(RBFInterpolator):
     -------
     __call__:
       Evaluate the interpolant at `x`.
+    call_many:
+      Evaluate the interpolant at each array in `xs` with a single call.
 
     """
     def __call__(self, x):
@@ -175,4 +182,27 @@ class RBFInterpolator2(RBFInterpolator):
             Values of the interpolant at `x`.
 
         """
-        return super().__call__(self, x)
+        return super().__call__(x)
+
+    def call_many(self, xs):
+        """Evaluate the interpolant at each array in `xs`.
+
+        The evaluation points are stacked and passed through a single call to
+        the interpolant, which avoids the per-call overhead of evaluating many
+        small batches one at a time.
+
+        Parameters
+        ----------
+        xs : sequence of (Q_i, N) array_like
+            Evaluation point coordinates, one array per batch.
+
+        Returns
+        -------
+        list of (Q_i, ...) ndarray
+            Values of the interpolant at each array in `xs`.
+
+        """
+        xs = [np.asarray(x) for x in xs]
+        sizes = [len(x) for x in xs]
+        y = super().__call__(np.concatenate(xs, axis=0))
+        return np.split(y, np.cumsum(sizes)[:-1])